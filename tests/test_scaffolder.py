@@ -0,0 +1,396 @@
+"""Validation tests for the scaffold-foundry-app test scenarios.
+
+Checks that every scenario in tests/scenarios/scaffold-foundry-app/scenarios.yaml
+is well-formed and that each mock_response actually satisfies the
+expected_patterns / forbidden_patterns it declares, so the TypeScript harness
+never evaluates against a broken fixture.
+
+Run with: pytest tests/test_scaffolder.py
+
+The parametrized pattern tests are independent per scenario and split
+cleanly across pytest-xdist workers: pytest tests/test_scaffolder.py -n auto.
+_load_scenarios() is a pure read with a module-global cache, so each worker
+parses scenarios.yaml at most once.
+"""
+
+import functools
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+import pytest
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is fine without it
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+class _FastStrLoader(SafeLoader):
+    """SafeLoader that hands back str scalars without resolver overhead.
+
+    Scenario files are dominated by large block-scalar strings
+    (mock_response, prompt); returning the node value directly skips the
+    construct_scalar path for every one of them.
+    """
+
+
+_FastStrLoader.add_constructor(
+    "tag:yaml.org,2002:str", lambda loader, node: node.value
+)
+
+_SCENARIOS_PATH = (
+    Path(__file__).resolve().parent / "scenarios" / "scaffold-foundry-app" / "scenarios.yaml"
+)
+# Stat once at import; the tree is stable for the lifetime of a test run, so
+# every later existence check reuses this bool instead of another syscall.
+_SCENARIOS_EXISTS = _SCENARIOS_PATH.is_file()
+# A pre-converted JSON sibling is preferred when present: JSON parsing is an
+# order of magnitude cheaper than YAML. The YAML file stays the source of
+# truth for the TS harness; the sibling is only ever a derived artifact, so
+# it is ignored when it predates the YAML it was generated from.
+_SCENARIOS_JSON_PATH = _SCENARIOS_PATH.with_suffix(".json")
+_SCENARIOS_JSON_EXISTS = _SCENARIOS_JSON_PATH.is_file() and (
+    not _SCENARIOS_EXISTS
+    or _SCENARIOS_JSON_PATH.stat().st_mtime >= _SCENARIOS_PATH.stat().st_mtime
+)
+
+# Case-insensitive checks compile once here rather than lowercasing a copy of
+# mock_response per call.
+_PASSWORD_RE = re.compile(r"password", re.IGNORECASE)
+
+_REQUIRED_SCENARIO_FIELDS = frozenset({"name", "prompt", "mock_response"})
+_REQUIRED_PYPROJECT_DEPS = ("fastapi", "pydantic", "pytest", "ruff", "azure-identity")
+
+_SCENARIOS_CACHE: dict | None = None
+_SCENARIOS_BY_NAME: dict[str, dict] = {}
+
+
+def _install_scenarios(data: dict) -> dict:
+    """Adopt parsed scenario data: memoize it, index it and run the scans."""
+    global _SCENARIOS_CACHE
+    _SCENARIOS_CACHE = data
+    for s in data.get("scenarios", []):
+        _SCENARIOS_BY_NAME[s["name"]] = s
+        _scan_patterns(s)
+    return data
+
+
+def _load_scenarios() -> dict:
+    """Read and parse scenarios.yaml once, memoizing the result.
+
+    The file is needed at collection time (parametrization) and again by the
+    fixtures; caching keeps that to a single read + parse per process. Also
+    populates the by-name index used for O(1) scenario lookup in tests.
+    """
+    if _SCENARIOS_CACHE is not None:
+        return _SCENARIOS_CACHE
+    if _SCENARIOS_JSON_EXISTS:
+        raw = _SCENARIOS_JSON_PATH.read_bytes()
+        data = (orjson.loads(raw) if orjson else json.loads(raw)) or {}
+    elif not _SCENARIOS_EXISTS:
+        data = {}
+    else:
+        with open(_SCENARIOS_PATH, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_FastStrLoader) or {}
+    return _install_scenarios(data)
+
+
+def _scan_patterns(scenario: dict) -> None:
+    """Run the pattern scans for one scenario and cache the results.
+
+    All declared patterns (expected and forbidden) are checked with a single
+    compiled alternation pass over mock_response, here at load time rather
+    than inside the tests; the per-pattern outcome is cached as the _hits set
+    and the _missing / _found_forbidden tuples the tests assert on. Regexes
+    are compiled once per process — test bodies must only use
+    compiled.search(...) or plain substring checks, since
+    re.search(string_pattern, ...) pays a cache lookup per call and the
+    internal re cache (_MAXCACHE=512) can be blown by large scenario files.
+    """
+    mock = scenario.get("mock_response", "")
+    expected = scenario.get("expected_patterns") or ()
+    forbidden = scenario.get("forbidden_patterns") or ()
+
+    hits = set()
+    if expected:
+        hits.update(
+            re.compile("|".join(re.escape(p) for p in expected)).findall(mock)
+        )
+        # findall reports only non-overlapping matches, so re-check apparent
+        # misses with substring search before trusting them.
+        hits.update(p for p in expected if p not in hits and p in mock)
+    if forbidden and re.compile(
+        "|".join(re.escape(p) for p in forbidden)
+    ).search(mock):
+        # Common case is no forbidden content: the single search above
+        # settles it in one pass, and the per-pattern scans below only run
+        # on the failure path to identify the offenders.
+        hits.update(p for p in forbidden if p in mock)
+
+    scenario["_hits"] = frozenset(hits)
+    scenario["_missing"] = tuple(p for p in expected if p not in hits)
+    scenario["_found_forbidden"] = tuple(p for p in forbidden if p in hits)
+
+
+def _scenario_names_from_node(root) -> list[str] | None:
+    """Extract scenario names from a composed YAML node tree.
+
+    Walks only the top-level scenario mappings and pulls each name scalar
+    without constructing the full Python object graph, which is where most
+    of a full yaml.load spends its time. Returns None when the tree doesn't
+    have the expected shape so the caller can fall back to a full load.
+    """
+    if not isinstance(root, yaml.MappingNode):
+        return []
+    for key_node, value_node in root.value:
+        if key_node.value != "scenarios":
+            continue
+        if not isinstance(value_node, yaml.SequenceNode):
+            return None
+        names = []
+        for item in value_node.value:
+            if not isinstance(item, yaml.MappingNode):
+                return None
+            for k, v in item.value:
+                if k.value == "name":
+                    names.append(v.value)
+                    break
+            else:
+                return None
+        return names
+    return []
+
+
+def get_scenario_names():
+    """Return the names of all scenarios defined in scenarios.yaml.
+
+    Collection-only runs (IDE discovery, --collect-only) need nothing but
+    the names, so when the full parse hasn't happened yet this composes the
+    node tree instead of constructing every scalar and mapping. Any surprise
+    in file shape falls back to the full cached load.
+    """
+    if _SCENARIOS_CACHE is not None or _SCENARIOS_JSON_EXISTS:
+        return [s["name"] for s in _load_scenarios().get("scenarios", [])]
+    if not _SCENARIOS_EXISTS:
+        return []
+    try:
+        with open(_SCENARIOS_PATH, encoding="utf-8") as f:
+            names = _scenario_names_from_node(yaml.compose(f, Loader=SafeLoader))
+    except yaml.YAMLError:
+        names = None
+    if names is None:
+        return [s["name"] for s in _load_scenarios().get("scenarios", [])]
+    return names
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the pattern tests over scenario names.
+
+    Doing this here instead of in @pytest.mark.parametrize decorators keeps
+    the scenarios.yaml read out of module import, so IDE discovery and
+    --collect-only runs that deselect this module never touch the file.
+    """
+    if "scenario_name" in metafunc.fixturenames:
+        metafunc.parametrize("scenario_name", get_scenario_names())
+
+
+_PYTEST_CACHE_KEY = "scaffolder/scenarios"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _persisted_scenarios(request):
+    """Reuse the parsed scenarios.yaml across pytest sessions.
+
+    The parse is stored in pytest's persistent cache keyed by the file's
+    (mtime_ns, size), so edits invalidate it automatically. On a hit the
+    module cache is populated without touching YAML at all; on a miss the
+    fresh parse is stored for the next session.
+    """
+    if _SCENARIOS_CACHE is not None or _SCENARIOS_JSON_EXISTS or not _SCENARIOS_EXISTS:
+        return
+    cache = getattr(request.config, "cache", None)
+    if cache is None:  # -p no:cacheprovider
+        return
+    st = _SCENARIOS_PATH.stat()
+    stat_key = [st.st_mtime_ns, st.st_size]
+    cached = cache.get(_PYTEST_CACHE_KEY, None)
+    if cached and cached.get("stat") == stat_key:
+        _install_scenarios(cached["data"])
+        return
+    data = _load_scenarios()
+    # The scans attach non-JSON-serializable private keys; persist a copy
+    # with only the YAML-sourced fields.
+    cache.set(
+        _PYTEST_CACHE_KEY,
+        {
+            "stat": stat_key,
+            "data": {
+                key: (
+                    [
+                        {k: v for k, v in s.items() if not k.startswith("_")}
+                        for s in value
+                    ]
+                    if key == "scenarios"
+                    else value
+                )
+                for key, value in data.items()
+            },
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def scenarios_data():
+    """Parsed contents of scenarios.yaml."""
+    data = _load_scenarios()
+    if not data:
+        pytest.skip("scenarios.yaml not found")
+    return data
+
+
+@pytest.fixture(scope="module")
+def scenarios(scenarios_data):
+    """The list of scenario definitions."""
+    return scenarios_data.get("scenarios", [])
+
+
+@functools.cache
+def _get_scenario(name: str) -> dict:
+    """Return the named scenario, skipping the calling test when absent."""
+    _load_scenarios()
+    scenario = _SCENARIOS_BY_NAME.get(name)
+    if scenario is None:
+        pytest.skip(f"{name} scenario not found")
+    return scenario
+
+
+def _scenario_hits(name: str) -> frozenset:
+    """Declared patterns of the named scenario that occur in its mock_response.
+
+    Backed by the single load-time scan; use it for presence checks on
+    literals that are declared in the scenario's pattern lists (an undeclared
+    literal fails loudly). Absence checks should keep scanning mock_response
+    directly so they cannot pass vacuously if a pattern is dropped from the
+    YAML.
+    """
+    return _get_scenario(name)["_hits"]
+
+
+# Every scenario's mock_response must match its own pattern contract. One
+# test node per scenario covers both checks — halving pytest's per-node
+# bookkeeping — and a failure reports every violated pattern of either kind
+# at once. Module-level functions (not a test class) let xdist's
+# loadscope/loadfile distribution split the parametrized IDs across workers
+# without dragging a shared instance along.
+def test_scenario_patterns(scenario_name):
+    scenario = _get_scenario(scenario_name)
+    problems = []
+    if scenario["_missing"]:
+        problems.append(f"missing expected patterns: {list(scenario['_missing'])}")
+    if scenario["_found_forbidden"]:
+        problems.append(
+            f"contains forbidden patterns: {list(scenario['_found_forbidden'])}"
+        )
+    assert not problems, (
+        f"Scenario '{scenario_name}' mock_response " + "; ".join(problems)
+    )
+
+
+# Structural sanity checks on the scenarios file itself.
+def test_scenarios_file_exists():
+    assert _SCENARIOS_EXISTS or _SCENARIOS_JSON_EXISTS, (
+        f"Missing scenarios file: {_SCENARIOS_PATH}"
+    )
+
+
+def test_all_scenarios_have_required_fields(scenarios):
+    for scenario in scenarios:
+        missing = _REQUIRED_SCENARIO_FIELDS.difference(scenario)
+        assert not missing, (
+            f"Scenario '{scenario.get('name', '<unnamed>')}' is missing "
+            f"required fields: {sorted(missing)}"
+        )
+
+
+def test_scenario_names_are_unique(scenarios):
+    counts = Counter(s["name"] for s in scenarios)
+    duplicates = [name for name, count in counts.items() if count > 1]
+    assert not duplicates, f"Duplicate scenario names: {sorted(duplicates)}"
+
+
+# Spot checks on the azd / Bicep scenarios.
+def test_azure_yaml_has_remote_build():
+    hits = _scenario_hits("azure_yaml_config")
+    assert "remoteBuild: true" in hits
+    assert "host: containerapp" in hits
+
+
+def test_bicep_has_managed_identity():
+    assert "managedIdentity" in _scenario_hits("bicep_main_module")
+    mock = _get_scenario("bicep_main_module")["mock_response"]
+    assert _PASSWORD_RE.search(mock) is None
+
+
+# Spot checks on the FastAPI / Python scenarios.
+def test_fastapi_uses_lifespan():
+    hits = _scenario_hits("fastapi_main")
+    assert "@asynccontextmanager" in hits
+    assert "async def lifespan" in hits
+
+
+def test_pyproject_has_required_deps():
+    hits = _scenario_hits("pyproject_toml")
+    missing = [dep for dep in _REQUIRED_PYPROJECT_DEPS if dep not in hits]
+    assert not missing, f"pyproject.toml mock is missing dependencies: {missing}"
+
+
+def test_pydantic_models_are_v2():
+    mock = _get_scenario("pydantic_models")["mock_response"]
+    assert "model_config" in mock
+    assert "class Config:" not in mock
+
+
+# Spot checks on the React / Vite scenarios.
+def test_vite_config_uses_esm():
+    assert "export default defineConfig" in _scenario_hits("vite_config")
+    mock = _get_scenario("vite_config")["mock_response"]
+    assert "module.exports" not in mock
+
+
+def test_package_json_uses_fluent_v9():
+    assert '"@fluentui/react-components":' in _scenario_hits("package_json")
+    mock = _get_scenario("package_json")["mock_response"]
+    assert '"@fluentui/react":' not in mock
+
+
+def test_app_uses_dark_theme():
+    hits = _scenario_hits("fluent_theme_provider")
+    assert "FluentProvider" in hits
+    assert "webDarkTheme" in hits
+    mock = _get_scenario("fluent_theme_provider")["mock_response"]
+    assert "webLightTheme" not in mock
+
+
+def test_tsconfig_is_strict():
+    assert '"strict": true' in _scenario_hits("tsconfig_strict")
+
+
+# Spot checks on the Dockerfile scenarios.
+def test_backend_dockerfile_uses_uv():
+    mock = _get_scenario("dockerfile_backend")["mock_response"]
+    assert "uv" in mock
+    assert "RUN pip install" not in mock
+
+
+def test_frontend_dockerfile_uses_pnpm():
+    assert "pnpm" in _scenario_hits("dockerfile_frontend")
+    mock = _get_scenario("dockerfile_frontend")["mock_response"]
+    assert "yarn" not in mock